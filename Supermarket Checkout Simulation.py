@@ -1,7 +1,22 @@
 from datetime import datetime
-import random
+from enum import IntEnum
+import heapq
+import sys
 import time
 
+import numpy as np
+
+# Numba is optional so the same file also runs under PyPy (pypy3 "Supermarket Checkout Simulation.py"), whose
+# tracing JIT compiles the hot loops itself. Without numba the batch kernel below runs as plain Python.
+try:
+    from numba import njit, prange
+except ImportError:
+    def njit(*args, **kwargs):
+        return lambda func: func
+
+    prange = range
+
+number_regular_lanes = 5
 max_regular = 5
 max_self_service = 15
 
@@ -9,60 +24,101 @@ max_self_service = 15
 cashier_fixed_time = 4
 self_service_fixed_time = 6
 
-# Get the current date and time
-current_time = datetime.now()  # Use datetime.now() directly
-# Format the timestamp as a string
-timestamp_str = current_time.strftime("%Y-%m-%d %H:%M:%S")
+# Random number generator for customer arrivals and basket sizes
+rng = np.random.default_rng()
+
+# Checkout duration in seconds for every basket size from 0 to 30 items: cashier time from 10 items on,
+# self service time below
+CHECKOUT_LUT = np.fromiter((items * (cashier_fixed_time if items >= 10 else self_service_fixed_time)
+                            for items in range(31)), dtype=np.int32)
+# Plain list copy for single lookups, which avoids boxing a NumPy scalar per customer
+_CHECKOUT_SECONDS = CHECKOUT_LUT.tolist()
+
+
+# Last formatted second and its timestamp string, shared by every fast_timestamp call
+_last_sec = [None, ""]
+
+
+def fast_timestamp(epoch=None):
+    """
+    Formats an epoch time as a "%Y-%m-%d %H:%M:%S" string, reusing the last result within the same second.
+
+    Parameters:
+    - epoch: Time in epoch seconds, the current time if omitted
+
+    Returns:
+    - The formatted timestamp string
+    """
+    s = int(time.time() if epoch is None else epoch)
+    if s != _last_sec[0]:
+        _last_sec[0] = s
+        _last_sec[1] = datetime.fromtimestamp(s).strftime("%Y-%m-%d %H:%M:%S")
+    return _last_sec[1]
+
+
+# Format the current date and time as a string
+timestamp_str = fast_timestamp()
 # Display the timestamp at the start of the simulation
 print(f"Simulation started at {timestamp_str}")
 
 
+class LaneStatus(IntEnum):
+    """
+    Status of a lane: closed or open to new customers. CLOSED is falsy, so hot checks test the status directly.
+    """
+    CLOSED = 0
+    OPEN = 1
+
+
 class Lane:
     """
         Represents 6 lanes in a store.
 
         Attributes:
         - lane_type: Type of the lane (Regular or Self Service)
-        - customers: List of Customer objects currently in the lane
+        - customers: Dictionary of the Customer objects currently in the lane keyed by identifier, in joining order
         - max_capacity: Maximum number of customers the lane can accommodate
         - timestamp: Timestamp representing when the lane was created
-        - status: Current status of the lane (Open or Closed)
+        - status: Current status of the lane (LaneStatus.OPEN or LaneStatus.CLOSED)
 
         Methods:
-        - __init__(self, lane_type, max_capacity, status="Closed"): Initializes a Lane object with the provided attributes.
-        - add_customer(self, customer): Adds a customer to the lane if it's open and has space.
+        - __init__(self, lane_type, max_capacity, status=LaneStatus.CLOSED): Initializes a Lane object with the provided attributes.
+        - add_customer(self, customer, log): Adds a customer to the lane if it's open and has space.
         - can_accept_customer(self, customer): Checks if the lane can accept the given customer.
-        - remove_customer(self, customer): Removes a customer from the lane if checkout conditions are met.
+        - remove_by_id(self, identifier, log): Removes the customer with the given identifier whose checkout is done.
         """
 
-    def __init__(self, lane_type, max_capacity, status="Closed"):
+    __slots__ = ('lane_type', 'customers', 'max_capacity', 'timestamp', 'status')
+
+    def __init__(self, lane_type, max_capacity, status=LaneStatus.CLOSED):
         """
         Represents a lane in the store.
 
         Parameters:
         - lane_type: Type of the lane (Regular or Self Service)
         - max_capacity: Maximum number of customers the lane can accommodate
-        - status: Current status of the lane (Open or Closed)
+        - status: Current status of the lane (LaneStatus.OPEN or LaneStatus.CLOSED)
         """
         self.lane_type = lane_type
-        self.customers = []
+        self.customers = {}
         self.max_capacity = max_capacity
         self.timestamp = datetime.now()
         self.status = status
 
-    def add_customer(self, customer):
+    def add_customer(self, customer, log):
         """
         Adds a customer to the lane if the lane is open and has space.
 
         Parameters:
         - customer: Customer object to be added to the lane
+        - log: List collecting the output messages of the current interval
 
         Returns:
         - True if the customer is added, False otherwise
         """
         if self.can_accept_customer(customer):
-            self.customers.append(customer)
-            print(f"C{customer.identifier} joined {self.lane_type}.")
+            self.customers[customer.identifier] = customer
+            log.append(f"C{customer.identifier} joined {self.lane_type}.")
             return True
         else:
             return False
@@ -77,20 +133,19 @@ class Lane:
         Returns:
         - True if the lane can accept the customer, False otherwise
         """
-        return len(self.customers) < self.max_capacity and self.status == "Open"
+        return len(self.customers) < self.max_capacity and self.status is LaneStatus.OPEN
 
-    def remove_customer(self, customer):
+    def remove_by_id(self, identifier, log):
         """
-        Removes a customer from the lane if checkout conditions are met.
+        Removes the customer with the given identifier from the lane once their checkout is done.
 
         Parameters:
-        - customer: Customer object to be removed from the lane
+        - identifier: Identifier of the customer to be removed from the lane
+        - log: List collecting the output messages of the current interval
         """
-        checkout_time = customer.checkout_time()  # Use the customer's checkout_time method
-        elapsed_time = datetime.now() - customer.join_timestamp
-        if elapsed_time.total_seconds() >= checkout_time:
-            self.customers.remove(customer)
-            print(f"C{customer.identifier} has completed checkout and left {self.lane_type}.")
+        # Keyed by identifier, so a customer leaves in O(1) from any position in the queue
+        if self.customers.pop(identifier, None) is not None:
+            log.append(f"C{identifier} has completed checkout and left {self.lane_type}.")
 
 
 class Status:
@@ -99,40 +154,39 @@ class Status:
 
         Attributes:
         - lanes: List of Lane objects
+        - next_regular_lane: Dictionary mapping each Regular lane type to the Regular lane after it
 
         Methods:
-        - __init__(self, lanes): Initializes a Status object with the provided list of Lane objects.
-        - open_next_lane(current_lane): Opens the next regular lane if conditions are met.
-        - set_statuses(lane): Sets the status of a lane based on the number of customers.
-        - display_status(*lanes): Displays the status of multiple lanes.
+        - __init__(self, lanes, regular_lanes): Initializes a Status object with the provided lists of Lane objects.
+        - open_next_lane(self, current_lane): Opens the next regular lane if conditions are met.
+        - set_statuses(self, lane): Sets the status of a lane based on the number of customers.
+        - display_status(*lanes, log): Displays the status of multiple lanes.
         """
 
-    def __init__(self, lanes):
+    def __init__(self, lanes, regular_lanes):
         """
         Represents the status of multiple lanes in the store.
 
         Parameters:
         - lanes: List of Lane objects
+        - regular_lanes: List of the Regular Lane objects, in lane order
         """
         self.lanes = lanes
+        self.next_regular_lane = {lane.lane_type: next_lane
+                                  for lane, next_lane in zip(regular_lanes, regular_lanes[1:])}
 
-    @staticmethod
-    def open_next_lane(current_lane):
+    def open_next_lane(self, current_lane):
         """
         Opens the next regular lane if conditions are met.
 
         Parameters:
         - current_lane: Type of the current lane
         """
+        next_lane = self.next_regular_lane.get(current_lane)
+        if next_lane is not None:
+            next_lane.status = LaneStatus.OPEN
 
-        lane_number = int(current_lane.split()[-1])
-        next_lane_type = f"Regular {lane_number + 1}"
-        for lane in lanes:
-            if lane.lane_type == next_lane_type and len(lane.customers) <= lane.max_capacity:
-                lane.status = "Open"
-
-    @staticmethod
-    def set_statuses(lane):
+    def set_statuses(self, lane):
         """
              Sets the status of a lane based on the number of customers.
 
@@ -140,53 +194,55 @@ class Status:
              - lane: Lane object
              """
         if len(lane.customers) == lane.max_capacity:
-            Status.open_next_lane(lane.lane_type)
-        elif len(lane.customers) == 0:
-            lane.status = "Closed"
+            self.open_next_lane(lane.lane_type)
         else:
-            lane.status = "Open"
+            lane.status = LaneStatus.OPEN if lane.customers else LaneStatus.CLOSED
 
     @staticmethod
-    def display_status(*lanes):
+    def display_status(*lanes, log):
         """
         Displays the status of multiple lanes.
 
         Parameters:
         - lanes: List of Lane objects
+        - log: List collecting the output messages of the current interval
         """
         for lane in lanes:
-            status_message = f"{lane.lane_type} --> {lane.status}"
+            status = "Open" if lane.status else "Closed"
             if lane.customers:
-                status_message += f" ({len(lane.customers)} customers): "
-                status_message += ", ".join(
-                    [f"C{customer.identifier} ({customer.items} items)" for customer in lane.customers])
-            print(status_message)
-        print()
+                customers_str = ", ".join(customer.descriptor for customer in lane.customers.values())
+                log.append(f"{lane.lane_type} --> {status} ({len(lane.customers)} customers): {customers_str}")
+            else:
+                log.append(f"{lane.lane_type} --> {status}")
+        log.append("")
 
 
 class Customer:
     latest_id = 0  # Class variable to track the latest customer identifier
 
-    def __init__(self):
+    __slots__ = ('identifier', 'items', 'join_epoch', 'checkout_seconds', 'departure_epoch', 'descriptor')
+
+    def __init__(self, items, join_epoch):
         Customer.latest_id += 1
         self.identifier = Customer.latest_id
-        self.items = random.randint(1, 30)
-        self.join_timestamp = datetime.now()
+        self.items = items
+        self.join_epoch = join_epoch
+        # The basket never changes, so work out the checkout duration and departure time once
+        self.checkout_seconds = _CHECKOUT_SECONDS[items]
+        self.departure_epoch = self.join_epoch + self.checkout_seconds
+        self.descriptor = f"C{self.identifier} ({self.items} items)"  # How the customer is shown in lane statuses
 
     def checkout_time(self):
-        if self.items >= 10:
-            return self.items * cashier_fixed_time
-        else:
-            return self.items * self_service_fixed_time
+        return self.checkout_seconds
 
 
-def assign_lane(customer, lanes, status_instance):
+def assign_lane(customer, regular_lanes, status_instance):
     """
     Assigns a lane to a customer based on the number of items in the basket and the availability of lanes.
 
     Parameters:
     - customer: Customer object
-    - lanes: List of Lane objects
+    - regular_lanes: List of the Regular Lane objects, in lane order
     - status_instance: Status object to manipulate the status of lanes
 
     Returns:
@@ -195,15 +251,14 @@ def assign_lane(customer, lanes, status_instance):
     if customer.items < 10:
         return "Self Service"
     else:
-        # Iterate through Regular lanes to find an available lane with space for the customer
-        for lane in lanes:
-            if lane.lane_type.startswith("Regular") and len(
-                    lane.customers) < lane.max_capacity and customer not in lane.customers:
+        # Iterate through Regular lanes to find an open lane with space for the customer
+        for lane in regular_lanes:
+            if lane.status and len(lane.customers) < lane.max_capacity:
                 return lane.lane_type
 
         # If all regular lanes are full, open the next regular lane if possible
-        for lane in lanes:
-            if lane.lane_type.startswith("Regular") and len(lane.customers) == lane.max_capacity:
+        for lane in regular_lanes:
+            if len(lane.customers) == lane.max_capacity:
                 status_instance.open_next_lane(lane.lane_type)
                 return lane.lane_type  # Assign the customer to the newly opened lane
 
@@ -211,21 +266,134 @@ def assign_lane(customer, lanes, status_instance):
     return "Self Service"
 
 
-def add_customer_to_lane(customer, lane_type, lanes, status_instance):
+def add_customer_to_lane(customer, lane_type, lanes_by_type, status_instance, log):
     """
     Adds a customer to the specified lane and updates the status of the lane.
 
     Parameters:
     - customer: Customer object to be added to the lane
     - lane_type: Type of the lane to which the customer should be added
-    - lanes: List of Lane objects
+    - lanes_by_type: Dictionary mapping each lane type to its Lane object
     - status_instance: Status object to manipulate the status of lanes
+    - log: List collecting the output messages of the current interval
+
+    Returns:
+    - The Lane object the customer joined, or None if the lane could not accept the customer.
     """
-    for lane in lanes:
-        if lane.lane_type == lane_type:
-            if lane.add_customer(customer):
-                status_instance.set_statuses(lane)
-            break
+    lane = lanes_by_type[lane_type]
+    if lane.add_customer(customer, log):
+        status_instance.set_statuses(lane)
+        return lane
+    return None
+
+
+@njit(cache=True)
+def _simulate_batch(n_intervals, seed, interval_seconds=30):
+    """
+    Runs many simulation intervals headless, without printing or real time.
+
+    Mirrors the lane assignment and status rules of the print-based simulation on plain NumPy arrays:
+    lanes 0 to number_regular_lanes - 1 are the Regular lanes and the last lane is Self Service. Each lane
+    keeps its customers as parallel items and remaining-seconds arrays filled up to its count.
+
+    Parameters:
+    - n_intervals: Number of intervals to simulate.
+    - seed: Seed for the random number generator.
+    - interval_seconds: The duration of each interval in seconds.
+
+    Returns:
+    - Tuple of two arrays of shape (n_intervals, number of lanes): the number of customers and the total number
+      of items in each lane at the end of each interval.
+    """
+    np.random.seed(seed)
+    n_lanes = number_regular_lanes + 1
+    self_service = number_regular_lanes
+
+    capacity = np.full(n_lanes, max_regular, dtype=np.int32)
+    capacity[self_service] = max_self_service
+    lane_size = max(max_regular, max_self_service)
+    items_in_lane = np.zeros((n_lanes, lane_size), dtype=np.int16)
+    remaining = np.zeros((n_lanes, lane_size), dtype=np.int32)
+    count = np.zeros(n_lanes, dtype=np.int32)
+    is_open = np.zeros(n_lanes, dtype=np.bool_)
+    is_open[0] = True
+    is_open[self_service] = True
+
+    occupancy = np.zeros((n_intervals, n_lanes), dtype=np.int32)
+    queued_items = np.zeros((n_intervals, n_lanes), dtype=np.int32)
+    for interval in range(n_intervals):
+        amount_customers = np.random.randint(1, 11)
+        items_batch = np.random.randint(1, 31, amount_customers).astype(np.int32)
+        checkout_batch = CHECKOUT_LUT[items_batch]
+        for customer in range(amount_customers):
+            items = items_batch[customer]
+            checkout_seconds = checkout_batch[customer]
+
+            # Same rules as assign_lane
+            lane = -1
+            if items < 10:
+                lane = self_service
+            else:
+                for regular in range(number_regular_lanes):
+                    if count[regular] < capacity[regular] and is_open[regular]:
+                        lane = regular
+                        break
+                if lane == -1:
+                    for regular in range(number_regular_lanes):
+                        if count[regular] == capacity[regular]:
+                            if regular + 1 < number_regular_lanes:
+                                is_open[regular + 1] = True
+                            lane = regular
+                            break
+                if lane == -1:
+                    lane = self_service
+
+            # Same rules as Lane.add_customer followed by Status.set_statuses
+            if count[lane] < capacity[lane] and is_open[lane]:
+                items_in_lane[lane, count[lane]] = items
+                remaining[lane, count[lane]] = checkout_seconds
+                count[lane] += 1
+                if count[lane] == capacity[lane]:
+                    if lane + 1 < number_regular_lanes:
+                        is_open[lane + 1] = True
+                else:
+                    is_open[lane] = True
+
+        # Lanes only change on arrival, so the whole interval can be counted down in one step
+        for lane in range(n_lanes):
+            n = count[lane]
+            remaining[lane, :n] -= interval_seconds
+            kept = np.where(remaining[lane, :n] > 0)[0]
+            count[lane] = kept.size
+            remaining[lane, :kept.size] = remaining[lane, kept]
+            items_in_lane[lane, :kept.size] = items_in_lane[lane, kept]
+            queued_items[interval, lane] = items_in_lane[lane, :kept.size].sum()
+
+        occupancy[interval, :] = count
+    return occupancy, queued_items
+
+
+@njit(parallel=True, cache=True)
+def _simulate_runs(seeds, n_intervals, interval_seconds=30):
+    """
+    Runs one independent headless simulation per seed, spread over all cores.
+
+    Parameters:
+    - seeds: Array of seeds, one per run.
+    - n_intervals: Number of intervals to simulate in each run.
+    - interval_seconds: The duration of each interval in seconds.
+
+    Returns:
+    - Array of shape (number of seeds, number of lanes) with the mean number of customers in each lane over the
+      intervals of each run.
+    """
+    n_lanes = number_regular_lanes + 1
+    mean_occupancy = np.zeros((seeds.size, n_lanes))
+    for run in prange(seeds.size):
+        occupancy, _ = _simulate_batch(n_intervals, seeds[run], interval_seconds)
+        for lane in range(n_lanes):
+            mean_occupancy[run, lane] = occupancy[:, lane].mean()
+    return mean_occupancy
 
 
 class Simulation:
@@ -234,25 +402,63 @@ class Simulation:
 
     Attributes:
     - lanes: List of Lane objects representing different checkout lanes in the store.
+    - regular_lanes: The Regular lanes from lanes, in lane order.
+    - lanes_by_type: Dictionary mapping each lane type to its Lane object.
     - status_instance: An instance of the Status class for managing and displaying the status of lanes.
+    - clock: The simulated current time in monotonic seconds, advanced from event to event instead of in real time.
+    - _wall_offset: Offset from the clock to epoch seconds, captured once at start-up. The printed "Timestamp:" values
+      are clock + _wall_offset, so they follow simulated time and drift from the wall clock while the user is at
+      the y/n prompt.
+    - events: Heap of pending checkout events as (departure_epoch, customer identifier, lane) tuples.
+    - _log: Output messages buffered until the end of the current interval.
 
     Methods:
-    - __init__(self, lanes, status_instance): Constructor method for initializing the Simulation object.
+    - __init__(self, lanes, regular_lanes, status_instance): Constructor method for initializing the Simulation object.
+    - schedule_departure(self, lane, customer): Schedules the checkout event of a customer who has just joined a lane.
     - simulate_interval(self, interval_seconds): Simulates a fixed time interval of customer behavior in the store.
+    - flush_log(self): Writes the buffered output messages to stdout in one go.
     - end_simulation(self): Asks the user if they want to end the simulation.
-    - run_simulation(self): Runs the main simulation loop until the user decides to end it.
+    - run_simulation(self, verbose=True, n_intervals=1000, seed=0): Runs the main simulation loop until the user
+      decides to end it, or a headless batch of intervals when verbose is False.
+    - run_monte_carlo(self, seeds, n_intervals=1000): Runs independent headless simulations in parallel, one per seed.
     """
 
-    def __init__(self, lanes, status_instance):
+    def __init__(self, lanes, regular_lanes, status_instance):
         """
         Initialize the Simulation object with lanes and a status instance.
 
         Parameters:
         - lanes: List of Lane objects representing different checkout lanes.
+        - regular_lanes: The Regular lanes from lanes, in lane order.
         - status_instance: An instance of the Status class.
         """
         self.lanes = lanes
+        self.regular_lanes = regular_lanes
+        self.lanes_by_type = {lane.lane_type: lane for lane in lanes}
         self.status_instance = status_instance
+        self.clock = time.monotonic()
+        self._wall_offset = time.time() - self.clock
+        self.events = []
+        self._log = []
+
+    def schedule_departure(self, lane, customer):
+        """
+        Schedule the checkout event of a customer who has just joined a lane.
+
+        Parameters:
+        - lane: Lane object the customer joined.
+        - customer: Customer object whose departure is scheduled.
+        """
+        # Identifiers are unique, so ties on the departure time never fall through to comparing lanes
+        heapq.heappush(self.events, (customer.departure_epoch, customer.identifier, lane))
+
+    def flush_log(self):
+        """
+        Write the buffered output messages to stdout with a single write and clear the buffer.
+        """
+        if self._log:
+            sys.stdout.write("\n".join(self._log) + "\n")
+            self._log.clear()
 
     def simulate_interval(self, interval_seconds):
         """
@@ -261,31 +467,37 @@ class Simulation:
         Parameters:
         - interval_seconds: The duration of the simulation interval in seconds.
         """
-        start_time = datetime.now()
+        start_time = self.clock
+        end_time = start_time + interval_seconds
 
         # Display the timestamp at the top of the status
-        timestamp_str = start_time.strftime("%Y-%m-%d %H:%M:%S")
-        print(f"Timestamp: {timestamp_str}")
-
-        # Generate random number of customers (up to 10) every 30 seconds
-        amount_customers = random.randint(1, 10)
-        print(f"Customers waiting to join Lanes: {amount_customers}")
-
-        for i in range(amount_customers):
-            customer = Customer()
-            lane_type = assign_lane(customer, self.lanes, self.status_instance)
-            add_customer_to_lane(customer, lane_type, self.lanes, self.status_instance)
-
-        while (datetime.now() - start_time).total_seconds() < interval_seconds:
-            time.sleep(1)  # Simulate time passing (1 second per iteration)
-
-            # Simulate the passage of time and remove customers who have finished checking out
-            for lane in self.lanes:
-                for customer in lane.customers[:]:
-                    lane.remove_customer(customer)
+        timestamp_str = fast_timestamp(start_time + self._wall_offset)
+        log = self._log
+        log.append(f"Timestamp: {timestamp_str}")
+
+        # Generate random number of customers (up to 10) every 30 seconds, each with 1 to 30 items
+        amount_customers = int(rng.integers(1, 11))
+        items_batch = rng.integers(1, 31, size=amount_customers)
+        log.append(f"Customers waiting to join Lanes: {amount_customers}")
+
+        for items in items_batch.tolist():
+            customer = Customer(items, start_time)
+            lane_type = assign_lane(customer, self.regular_lanes, self.status_instance)
+            lane = add_customer_to_lane(customer, lane_type, self.lanes_by_type, self.status_instance, log)
+            if lane is not None:
+                self.schedule_departure(lane, customer)
+
+        # Jump from one checkout event to the next instead of polling every second; popping an event
+        # means the customer's departure time has been reached
+        events = self.events
+        while events and events[0][0] <= end_time:
+            _, identifier, lane = heapq.heappop(events)
+            lane.remove_by_id(identifier, log)
+        self.clock = end_time
 
         # Display the current status at the end of the interval
-        self.status_instance.display_status(*self.lanes)
+        self.status_instance.display_status(*self.lanes, log=log)
+        self.flush_log()
 
     def end_simulation(self):
         """
@@ -297,32 +509,61 @@ class Simulation:
         user_input = input("Do you want to end the simulation? (y/n): ").lower()
         return user_input == 'y'
 
-    def run_simulation(self):
+    def run_simulation(self, verbose=True, n_intervals=1000, seed=0):
         """
         Run the main simulation loop until the user decides to end it.
+
+        Parameters:
+        - verbose: If False, skip the interactive loop and run n_intervals with the compiled batch kernel instead.
+        - n_intervals: Number of intervals to run when verbose is False.
+        - seed: Seed for the random number generator when verbose is False.
+
+        Returns:
+        - None, or the per-interval lane occupancy and queued items arrays from _simulate_batch when verbose is
+          False.
         """
+        if not verbose:
+            return _simulate_batch(n_intervals, seed)
+
         while True:
             self.simulate_interval(30)  # Simulate every 30 seconds
             if self.end_simulation():
                 break
 
         # Display the final status
-        self.status_instance.display_status(*self.lanes)
+        self.status_instance.display_status(*self.lanes, log=self._log)
+        self.flush_log()
+
+    def run_monte_carlo(self, seeds, n_intervals=1000):
+        """
+        Run independent headless simulations in parallel, one per seed.
+
+        Parameters:
+        - seeds: Sequence of seeds, one per run.
+        - n_intervals: Number of intervals to simulate in each run.
+
+        Returns:
+        - The per-run mean lane occupancy array from _simulate_runs.
+        """
+        return _simulate_runs(np.asarray(seeds, dtype=np.int64), n_intervals)
 
 
 # Create a list of Regular lanes and a Self Service lane
-lanes = [Lane(lane_type=f"Regular {i + 1}", max_capacity=max_regular, status="Open" if i == 0 else "Closed") for i in
-         range(5)]
-lanes.append(Lane(lane_type="Self Service", max_capacity=max_self_service, status="Open"))
+lanes = [Lane(lane_type=f"Regular {i + 1}", max_capacity=max_regular,
+              status=LaneStatus.OPEN if i == 0 else LaneStatus.CLOSED) for i in range(number_regular_lanes)]
+lanes.append(Lane(lane_type="Self Service", max_capacity=max_self_service, status=LaneStatus.OPEN))
+
+# Collect the Regular lanes once so lane assignment does not have to filter them per customer
+regular_lanes = [lane for lane in lanes if lane.lane_type.startswith("Regular")]
 
 # Selecting the first Regular lane as the initial lane for simulation
 initial_lane = lanes[0]
 
 # Creating an instance of the Status class to manage and display the status of all lanes
-status_instance = Status(lanes)
+status_instance = Status(lanes, regular_lanes)
 
 # Create an instance of the Simulation class with existing lanes and status_instance
-simulation_instance = Simulation(lanes, status_instance)
+simulation_instance = Simulation(lanes, regular_lanes, status_instance)
 
 # Run the simulation
 simulation_instance.run_simulation()